@@ -6,13 +6,15 @@ import shlex
 import sys
 from enum import Enum
 from pathlib import Path
-from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Set, Tuple, Type, Union
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterable, List, Optional, Set, Tuple, Type, Union
 
 import jinja2
 import jinja2.meta
 
 from balsam.schemas import DeserializeError, JobState, SerializeError, deserialize, get_source, serialize
 
+from .cache import TTLCache
+
 if TYPE_CHECKING:
     from balsam.client import RESTClient
 
@@ -212,8 +214,9 @@ class ApplicationDefinition(metaclass=ApplicationDefinitionMeta):
     _client: Optional["RESTClient"] = None
     _app_type: AppType
     __app_id__: Optional[int] = None
-    _app_name_cache: Dict[Tuple[Optional[str], str], AppDefType] = {}
-    _app_id_cache: Dict[int, AppDefType] = {}
+    _app_name_cache: "TTLCache[Tuple[Optional[str], str], AppDefType]" = TTLCache(maxsize=1024, ttl=300)
+    _app_id_cache: "TTLCache[int, AppDefType]" = TTLCache(maxsize=1024, ttl=300)
+    _loaded_site_ids: Set[int] = set()  # Sites passed to load_by_site: kept across fork for refill_site_cache
     _serialized_class: Optional[str] = None
 
     @staticmethod
@@ -328,31 +331,120 @@ class ApplicationDefinition(metaclass=ApplicationDefinitionMeta):
         api_apps = AppModel.objects.filter(**lookup)  # type: ignore
         apps_by_name = {}
         for app in api_apps:
+            ApplicationDefinition._loaded_site_ids.add(app.site_id)
             apps_by_name[app.name] = ApplicationDefinition.from_serialized(app)
             assert app.id is not None
-            ApplicationDefinition._app_id_cache[app.id] = apps_by_name[app.name]
+            ApplicationDefinition._cache_put(app.id, apps_by_name[app.name])
         return apps_by_name
 
+    @staticmethod
+    def refill_site_cache(site_id: Optional[int] = None) -> None:
+        """
+        Load every App registered at `site_id` into the cache with a single request
+        (e.g. in a forked process, whose cache is cleared at fork). By default, refills
+        the Sites whose Apps were previously loaded with `load_by_site`.
+        Apps that fail to deserialize are skipped: they fail again when loaded by ID.
+        """
+        site_ids = [site_id] if site_id is not None else sorted(ApplicationDefinition._loaded_site_ids)
+        if not site_ids:
+            return
+        logger.debug(f"Refilling App Cache for Sites {site_ids}")
+        for api_app in ApplicationDefinition._App.objects.filter(site_id=site_ids):
+            assert api_app.id is not None
+            try:
+                app_def = ApplicationDefinition.from_serialized(api_app)
+            except DeserializeError as exc:
+                logger.debug(f"Not caching App(id={api_app.id}): {exc}")
+            else:
+                ApplicationDefinition._cache_put(api_app.id, app_def)
+
     @classmethod
     def load_by_name(cls, app_name: str, site_name: Optional[str] = None) -> AppDefType:
         app_key = (site_name, app_name)
-        if app_key not in cls._app_name_cache:
+        app_def = cls._app_name_cache.get(app_key)
+        if app_def is None:
             logger.debug(f"App Cache miss: fetching app {app_key}")
             app: "App" = cls._App.objects.get(site_name=site_name, name=app_name)
             assert app.id is not None
             app_def = cls.from_serialized(app)
-            cls._app_name_cache[app_key] = app_def
-            cls._app_id_cache[app.id] = app_def
-        return cls._app_name_cache[app_key]
+            cls._cache_put(app.id, app_def, name_key=app_key)
+        return app_def
 
     @classmethod
-    def load_by_id(cls, app_id: int) -> AppDefType:
-        if app_id not in cls._app_id_cache:
+    def load_by_id(cls, app_id: int, force_refresh: bool = False) -> AppDefType:
+        """
+        Load the ApplicationDefinition with the given ID. Uses the local cache
+        unless `force_refresh=True`, which always re-fetches the App from the API.
+        """
+        app_def = None if force_refresh else cls._app_id_cache.get(app_id)
+        if app_def is None:
             logger.debug(f"App Cache miss: fetching app {app_id}")
             api_app: "App" = cls._App.objects.get(id=app_id)
             app_def = cls.from_serialized(api_app)
-            cls._app_id_cache[app_id] = app_def
-        return cls._app_id_cache[app_id]
+            cls._cache_put(app_id, app_def)
+        return app_def
+
+    @classmethod
+    def load_by_ids(cls, app_ids: Iterable[int]) -> Dict[int, AppDefType]:
+        """
+        Load several apps at once, fetching all cache misses in a single query.
+        Apps that fail to deserialize are logged and left out of the result.
+        """
+        app_defs: Dict[int, AppDefType] = {}
+        missing: List[int] = []
+        for app_id in set(app_ids):
+            app_def = cls._app_id_cache.get(app_id)
+            if app_def is None:
+                missing.append(app_id)
+            else:
+                app_defs[app_id] = app_def
+        if missing:
+            logger.debug(f"App Cache miss: fetching apps {missing}")
+            for api_app in cls._App.objects.filter(id=missing):
+                assert api_app.id is not None
+                try:
+                    app_defs[api_app.id] = cls.from_serialized(api_app)
+                except DeserializeError as exc:
+                    logger.warning(f"Skipping App(id={api_app.id}) that failed to deserialize: {exc}")
+                else:
+                    cls._cache_put(api_app.id, app_defs[api_app.id])
+        return app_defs
+
+    @staticmethod
+    def _cache_put(app_id: int, app_def: AppDefType, name_key: Optional[Tuple[Optional[str], str]] = None) -> None:
+        ApplicationDefinition._app_id_cache[app_id] = app_def
+        if name_key is not None:
+            ApplicationDefinition._app_name_cache[name_key] = app_def
+
+    @staticmethod
+    def _invalidate_cache(app_id: int) -> None:
+        """
+        Drop any cached ApplicationDefinition for `app_id` (e.g. after the App was updated or deleted)
+        """
+        ApplicationDefinition._app_id_cache.pop(app_id, None)
+        name_cache = ApplicationDefinition._app_name_cache
+        for key in list(name_cache):
+            app_def = name_cache.get(key)
+            if app_def is not None and app_def.__app_id__ == app_id:
+                name_cache.pop(key, None)
+
+    @staticmethod
+    def _invalidate_site_cache(site_name: str) -> None:
+        """
+        Drop any cached ApplicationDefinition that may belong to the Site `site_name` (e.g. after the
+        Site and its Apps were deleted). Lookups made without a site name may resolve to that Site too.
+        """
+        name_cache = ApplicationDefinition._app_name_cache
+        for key in list(name_cache):
+            if key[0] in (site_name, None):
+                app_def = name_cache.pop(key, None)
+                if app_def is not None and app_def.__app_id__ is not None:
+                    ApplicationDefinition._app_id_cache.pop(app_def.__app_id__, None)
+
+    @staticmethod
+    def _clear_cache() -> None:
+        ApplicationDefinition._app_id_cache.clear()
+        ApplicationDefinition._app_name_cache.clear()
 
     @classmethod
     def sync(cls, rename_from: Optional[str] = None) -> None:
@@ -375,13 +467,13 @@ class ApplicationDefinition(metaclass=ApplicationDefinitionMeta):
             existing_app.save()
             cls.__app_id__ = existing_app.id
             assert existing_app.id is not None
-            cls._app_id_cache[existing_app.id] = cls
+            cls._cache_put(existing_app.id, cls)
         else:
             new_app = AppModel.objects.create(**app_dict)
             logger.info(f"Created new App(id={new_app.id}, name={app_dict['name']})")
             cls.__app_id__ = new_app.id
             assert new_app.id is not None
-            cls._app_id_cache[new_app.id] = cls
+            cls._cache_put(new_app.id, cls)
 
     @classmethod
     def submit(
@@ -471,3 +563,8 @@ class ApplicationDefinition(metaclass=ApplicationDefinitionMeta):
         cls.__app_id__ = app.id
         cls._serialized_class = app.serialized_class
         return cls
+
+
+# Forked workers must not trust Apps cached by the parent, which may since have been updated
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=ApplicationDefinition._clear_cache)
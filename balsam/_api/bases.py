@@ -2,14 +2,30 @@ import concurrent.futures
 import logging
 import time
 from pathlib import Path
-from typing import TYPE_CHECKING, Any, Dict, Iterator, List, NamedTuple, Optional, Set, Type, Union
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Set,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+)
 
 from balsam import schemas
 from balsam.schemas import JobState, deserialize, raise_from_serialized, serialize
 
 from .app import ApplicationDefinition
-from .manager import Manager
+from .manager import FILTER_CHUNK_SIZE, Manager, chunk_list
 from .model import CreatableBalsamModel, Field, NonCreatableBalsamModel
+from .query import Query
 
 if TYPE_CHECKING:
     from balsam._api.models import (  # noqa: F401
@@ -28,6 +44,7 @@ if TYPE_CHECKING:
 JobTransferItem = schemas.JobTransferItem
 RUNNABLE_STATES = schemas.RUNNABLE_STATES
 DONE_STATES = schemas.DONE_STATES
+JQ = TypeVar("JQ", bound="JobQueryBase")
 
 logger = logging.getLogger(__name__)
 
@@ -41,6 +58,12 @@ class SiteBase(CreatableBalsamModel):
 class SiteManagerBase(Manager["Site"]):
     _api_path = "sites/"
 
+    def _do_delete(self, instance: "Site") -> None:
+        site_name = instance.name
+        super()._do_delete(instance)
+        # The server deletes the Site's Apps along with it
+        ApplicationDefinition._invalidate_site_cache(site_name)
+
 
 class AppBase(CreatableBalsamModel):
     _create_model_cls = schemas.AppCreate
@@ -51,6 +74,17 @@ class AppBase(CreatableBalsamModel):
 class AppManagerBase(Manager["App"]):
     _api_path = "apps/"
 
+    def _do_update(self, instance: "App") -> None:
+        super()._do_update(instance)
+        assert instance.id is not None
+        ApplicationDefinition._invalidate_cache(instance.id)
+
+    def _do_delete(self, instance: "App") -> None:
+        app_id = instance.id
+        assert app_id is not None
+        super()._do_delete(instance)
+        ApplicationDefinition._invalidate_cache(app_id)
+
 
 class BatchJobBase(CreatableBalsamModel):
     _create_model_cls = schemas.BatchJobCreate
@@ -83,28 +117,25 @@ class BatchJobBase(CreatableBalsamModel):
 
         if self.project not in allowed_projects:
             raise ValueError(f"Unknown project {self.project} " f"(known: {allowed_projects})")
-        if self.partitions:
-            if sum(part.num_nodes for part in self.partitions) != self.num_nodes:
-                raise ValueError("Sum of partition sizes must equal batchjob num_nodes")
+        if self.partitions and sum(part.num_nodes for part in self.partitions) != self.num_nodes:
+            raise ValueError("Sum of partition sizes must equal batchjob num_nodes")
 
-        extras = set(self.optional_params.keys())
-        allowed_extras = set(optional_batch_job_params.keys())
-        extraneous = extras.difference(allowed_extras)
+        extraneous = self.optional_params.keys() - optional_batch_job_params.keys()
         if extraneous:
+            allowed_extras = set(optional_batch_job_params)
             raise ValueError(f"Extraneous optional_params: {extraneous} " f"(allowed extras: {allowed_extras})")
 
     def partitions_to_cli_args(self) -> str:
         if not self.partitions:
             return ""
-        args = ""
+        args = []
         for part in self.partitions:
-            job_mode = part.job_mode
-            num_nodes = part.num_nodes
+            arg = f" --part {part.job_mode}:{part.num_nodes}"
             filter_tags = ":".join(f"{k}={v}" for k, v in part.filter_tags.items())
-            args += f" --part {job_mode}:{num_nodes}"
             if filter_tags:
-                args += f":{filter_tags}"
-        return args
+                arg += f":{filter_tags}"
+            args.append(arg)
+        return "".join(args)
 
 
 class BatchJobManagerBase(Manager["BatchJob"]):
@@ -116,6 +147,31 @@ AppDefType = Type[ApplicationDefinition]
 InputAppType = Union[int, str, AppDefType]
 
 
+def _app_id_from_id(app_id: int, site_name: Optional[str]) -> int:
+    return app_id
+
+
+def _app_id_from_name(app_name: str, site_name: Optional[str]) -> int:
+    app = ApplicationDefinition.load_by_name(app_name, site_name)
+    assert app.__app_id__ is not None
+    return app.__app_id__
+
+
+def _app_id_from_appdef(app: AppDefType, site_name: Optional[str]) -> int:
+    if app.__app_id__ is None:
+        raise ValueError(
+            f"Cannot resolve ID from ApplicationDefinition {app}: __app_id__ is None. You need to app.sync() prior to creating Jobs with this app."
+        )
+    return app.__app_id__
+
+
+# Resolves the App ID from the exact type of the `app_id` argument (fast path for JobBase._resolve_app_id)
+_APP_ID_RESOLVERS: Dict[type, Callable[[Any, Optional[str]], int]] = {
+    int: _app_id_from_id,
+    str: _app_id_from_name,
+}
+
+
 class JobBase(CreatableBalsamModel):
     _create_model: Optional[schemas.JobCreate]
     _update_model: Optional[schemas.JobUpdate]
@@ -139,19 +195,23 @@ class JobBase(CreatableBalsamModel):
 
     @classmethod
     def _resolve_app_id(cls, app: InputAppType, site_name: Optional[str]) -> int:
-        if isinstance(app, int):
-            app_id = app
-        elif isinstance(app, str):
-            app = ApplicationDefinition.load_by_name(app, site_name)
-            assert app.__app_id__ is not None
-            app_id = app.__app_id__
-        else:
-            if app.__app_id__ is None:
-                raise ValueError(
-                    f"Cannot resolve ID from ApplicationDefinition {app}: __app_id__ is None. You need to app.sync() prior to creating Jobs with this app."
-                )
-            app_id = app.__app_id__
-        return app_id
+        resolver = _APP_ID_RESOLVERS.get(type(app))
+        if resolver is None:
+            # Subclasses of int and str (e.g. str Enums) miss the exact-type lookup
+            if isinstance(app, int):
+                resolver = _app_id_from_id
+            elif isinstance(app, str):
+                resolver = _app_id_from_name
+            else:
+                resolver = _app_id_from_appdef
+        return resolver(app, site_name)
+
+    @classmethod
+    def _prefetch_apps(cls, app_ids: Iterable[int]) -> None:
+        """
+        Warm the App cache for many Jobs with a single API request
+        """
+        ApplicationDefinition.load_by_ids(app_ids)
 
     @property
     def app(self) -> AppDefType:
@@ -255,6 +315,33 @@ class JobBase(CreatableBalsamModel):
         return self.objects.filter(id=list(self.parent_ids))
 
 
+class JobQueryBase(Query["Job"]):
+    def __init__(self, manager: "Manager[Job]") -> None:
+        super().__init__(manager=manager)
+        self._prefetch_apps: bool = False
+
+    def _clone(self: "JQ") -> "JQ":
+        clone = super()._clone()
+        clone._prefetch_apps = self._prefetch_apps
+        return clone
+
+    def _fetch_cache(self) -> None:
+        if self._result_cache is not None:
+            return
+        super()._fetch_cache()
+        if self._prefetch_apps and self._result_cache:
+            JobBase._prefetch_apps(job.app_id for job in self._result_cache)
+
+    def prefetch_apps(self: "JQ") -> "JQ":
+        """
+        Eagerly load the ApplicationDefinitions of all Jobs in this Query
+        with one request, rather than one request per Job on access to `job.app`.
+        """
+        clone = self._clone()
+        clone._prefetch_apps = True
+        return clone
+
+
 class JobWaitResult(NamedTuple):
     done: List["Job"]
     not_done: List["Job"]
@@ -266,6 +353,32 @@ class JobManagerBase(Manager["Job"]):
     _bulk_update_enabled = True
     _bulk_delete_enabled = True
 
+    def bulk_create_with_apps(
+        self,
+        specs: List[Dict[str, Any]],
+        app: Optional[InputAppType] = None,
+        site_name: Optional[str] = None,
+    ) -> List["Job"]:
+        """
+        Create Jobs in bulk from a list of Job constructor kwargs. Each distinct
+        App (given by the `app_id` key of a spec, or by `app` for specs without one)
+        is resolved only once, rather than once per Job.  App names are looked up
+        at the spec's `site_name`, falling back to `site_name`.
+        """
+        app_ids: Dict[Tuple[InputAppType, Optional[str]], int] = {}
+        jobs = []
+        for spec in specs:
+            spec = spec.copy()
+            app_ref = spec.pop("app_id", app)
+            spec_site = spec.pop("site_name", site_name)
+            if app_ref is None:
+                raise ValueError(f"No app_id given for Job spec {spec}")
+            key = (app_ref, spec_site)
+            if key not in app_ids:
+                app_ids[key] = self._model_class._resolve_app_id(app_ref, spec_site)
+            jobs.append(self._model_class(app_id=app_ids[key], **spec))
+        return self.bulk_create(jobs)
+
     def bulk_refresh(self, jobs: List["Job"]) -> None:
         """
         Refresh the list of Jobs from the latest database state
@@ -410,6 +523,29 @@ class SessionManagerBase(Manager["Session"]):
     def _do_tick(self, instance: "SessionBase") -> None:
         self._client.put(self._api_path + f"{instance.id}")
 
+    def tick_many(self, sessions: List["SessionBase"]) -> None:
+        """
+        Send a heartbeat to several Sessions with a single request.
+        """
+        session_ids = [sess.id for sess in sessions if sess.id is not None]
+        for ids_chunk in chunk_list(session_ids, chunk_size=FILTER_CHUNK_SIZE):
+            self._client.bulk_put(self._api_path, None, id=ids_chunk)
+
+    def acquire_many(
+        self, sessions: List["SessionBase"], max_workers: int = 8, **acquire_kwargs: Any
+    ) -> "List[List[Job]]":
+        """
+        Acquire Jobs for several Sessions with concurrent requests. Takes the
+        same keyword arguments as `Session.acquire_jobs` and returns the list
+        of acquired Jobs for each Session, in order.
+        """
+
+        def _acquire(session: "SessionBase") -> "List[Job]":
+            return session.acquire_jobs(**acquire_kwargs)
+
+        with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(_acquire, sessions))
+
 
 class TransferItemBase(NonCreatableBalsamModel):
     _create_model_cls = None
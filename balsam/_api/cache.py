@@ -0,0 +1,59 @@
+import time
+from collections import OrderedDict
+from typing import Callable, Iterator, MutableMapping, Tuple, TypeVar
+
+K = TypeVar("K")
+V = TypeVar("V")
+
+
+class TTLCache(MutableMapping[K, V]):
+    """
+    A size-bounded mapping whose entries expire `ttl` seconds after insertion.
+    When full, the least-recently-used entry is evicted.
+    """
+
+    def __init__(self, maxsize: int = 1024, ttl: float = 300.0, timer: Callable[[], float] = time.monotonic) -> None:
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._timer = timer
+        self._data: "OrderedDict[K, Tuple[float, V]]" = OrderedDict()
+
+    def __getitem__(self, key: K) -> V:
+        expires, value = self._data[key]
+        if expires <= self._timer():
+            del self._data[key]
+            raise KeyError(key)
+        self._data.move_to_end(key)
+        return value
+
+    def __setitem__(self, key: K, value: V) -> None:
+        self._data[key] = (self._timer() + self.ttl, value)
+        self._data.move_to_end(key)
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+    def __delitem__(self, key: K) -> None:
+        del self._data[key]
+
+    def __contains__(self, key: object) -> bool:
+        try:
+            self[key]  # type: ignore
+        except KeyError:
+            return False
+        return True
+
+    def _expire(self) -> None:
+        now = self._timer()
+        for key in [k for k, (expires, _) in self._data.items() if expires <= now]:
+            del self._data[key]
+
+    def __iter__(self) -> Iterator[K]:
+        self._expire()
+        return iter(list(self._data))
+
+    def __len__(self) -> int:
+        self._expire()
+        return len(self._data)
+
+    def clear(self) -> None:
+        self._data.clear()
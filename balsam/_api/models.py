@@ -495,7 +495,7 @@ class Job(balsam._api.bases.JobBase):
         return super().__init__(**_kwargs)
 
 
-class JobQuery(Query[Job]):
+class JobQuery(balsam._api.bases.JobQueryBase):
     def get(
         self,
         id: Union[typing.List[int], int, None] = None,
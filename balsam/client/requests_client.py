@@ -8,6 +8,11 @@ from typing import Any, Dict, List, Optional, Type, Union
 
 import requests
 
+try:
+    from orjson import loads as json_loads
+except ModuleNotFoundError:
+    from json import loads as json_loads
+
 from . import urls
 from .rest_base_client import RESTClient
 
@@ -103,7 +108,7 @@ class RequestsClient(RESTClient):
                 self.backoff(exc)
             else:
                 try:
-                    return response.json()  # type: ignore
+                    return json_loads(response.content)  # type: ignore
                 except (ValueError, JSONDecodeError):
                     if http_method != "DELETE":
                         raise
@@ -8,6 +8,7 @@ import click
 
 from balsam import __version__
 from balsam.cmdline import app, job, login, scheduler, site
+from balsam.cmdline.utils import BalsamGroup
 
 server: Optional[ModuleType]
 
@@ -18,20 +19,8 @@ except ModuleNotFoundError as e:
     logger.debug(f"Balsam server not installed: {e}")
     server = None
 
-# Monkey-patch make_default_short_help: cut off after first line
-_old_shorthelp = click.utils.make_default_short_help
 
-
-def _new_shorthelp(help: str, max_length: int = 45) -> str:
-    help = help.lstrip().split("\n")[0]
-    return str(_old_shorthelp(help, max_length))
-
-
-click.utils.make_default_short_help = _new_shorthelp
-click.core.make_default_short_help = _new_shorthelp  # type: ignore
-
-
-@click.group()
+@click.group(cls=BalsamGroup)
 @click.version_option(version=__version__)
 def _main() -> None:
     """
@@ -3,10 +3,10 @@ import yaml
 
 from balsam.config import ClientSettings
 
-from .utils import filter_by_sites
+from .utils import BalsamGroup, filter_by_sites
 
 
-@click.group()
+@click.group(cls=BalsamGroup)
 def app() -> None:
     """
     Manage Balsam applications
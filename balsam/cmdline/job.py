@@ -6,14 +6,14 @@ import yaml
 
 from balsam.schemas import JobState, JobTransferItem
 
-from .utils import filter_by_sites, load_client, table_print, validate_tags
+from .utils import BalsamGroup, filter_by_sites, load_client, table_print, validate_tags
 
 if TYPE_CHECKING:
     from balsam._api.models import App, AppQuery, JobQuery
     from balsam.client import RESTClient  # noqa: F401
 
 
-@click.group()
+@click.group(cls=BalsamGroup)
 def job() -> None:
     """
     Create and monitor Balsam Jobs
@@ -5,6 +5,8 @@ import click
 from balsam.client import NotAuthenticatedError, RequestsClient, urls
 from balsam.config import ClientSettings
 
+from .utils import BalsamCommand
+
 
 def is_auth() -> bool:
     """
@@ -19,7 +21,7 @@ def is_auth() -> bool:
     return client._authenticated
 
 
-@click.command()
+@click.command(cls=BalsamCommand)
 @click.option("-u", "--url", default="https://balsam-dev.alcf.anl.gov", help="Balsam server address")
 @click.option("-f", "--force", is_flag=True, default=False, help="Force redo, even if logged in")
 def login(url: str, force: bool) -> None:
@@ -47,7 +49,7 @@ def login(url: str, force: bool) -> None:
         updated_settings.save_to_file()
 
 
-@click.command()
+@click.command(cls=BalsamCommand)
 @click.option("-a", "--address", prompt="Balsam server address", help="Balsam server address")
 @click.option("-u", "--username", prompt="Balsam username", help="Balsam username")
 def register(address: str, username: str) -> None:
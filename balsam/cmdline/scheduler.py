@@ -5,10 +5,17 @@ import yaml
 
 from balsam.schemas import BatchJobPartition, BatchJobState, JobMode
 
-from .utils import filter_by_sites, load_client, load_site_from_selector, validate_partitions, validate_tags
+from .utils import (
+    BalsamGroup,
+    filter_by_sites,
+    load_client,
+    load_site_from_selector,
+    validate_partitions,
+    validate_tags,
+)
 
 
-@click.group()
+@click.group(cls=BalsamGroup)
 def queue() -> None:
     """
     Submit and monitor BatchJobs (queued launcher pilots)
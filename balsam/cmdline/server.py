@@ -11,13 +11,15 @@ import jinja2
 
 import balsam.server
 
+from .utils import BalsamGroup
+
 REDIS_TMPL = Path(balsam.server.__file__).parent.joinpath("redis.conf.tmpl")
 
 # NOTE: lazy-import balsam.util.postgres inside each CLI handler
 # Because psycopg2 is slow to import
 
 
-@click.group()
+@click.group(cls=BalsamGroup)
 def server() -> None:
     """
     Deploy and manage a local Balsam server
@@ -11,6 +11,7 @@ from balsam.util import globus_auth
 
 from .utils import (
     PID_FILENAME,
+    BalsamGroup,
     check_killable,
     get_pidfile,
     is_site_active,
@@ -21,7 +22,7 @@ from .utils import (
 )
 
 
-@click.group()
+@click.group(cls=BalsamGroup)
 def site() -> None:
     """
     Setup or manage your Balsam sites
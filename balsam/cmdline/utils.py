@@ -5,7 +5,7 @@ import sys
 import time
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple, TypeVar, Union, cast
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple, TypeVar, Union
 
 import click
 import psutil  # type: ignore
@@ -24,6 +24,31 @@ T = TypeVar("T", AppQuery, JobQuery, BatchJobQuery)
 PID_FILENAME = "balsam-service.pid"
 
 
+def _first_line_short_help(cmd: click.Command, limit: int) -> Optional[str]:
+    if cmd.short_help or not cmd.help:
+        return None
+    return click.utils.make_default_short_help(cmd.help.lstrip().partition("\n")[0], limit)
+
+
+class BalsamCommand(click.Command):
+    """Command whose short help (in the parent's listing) is cut off after the first line"""
+
+    def get_short_help_str(self, limit: int = 45) -> str:
+        short_help = _first_line_short_help(self, limit)
+        return super().get_short_help_str(limit) if short_help is None else short_help
+
+
+class BalsamGroup(click.Group):
+    """Group whose own short help, and that of the commands it creates, is cut off after the first line"""
+
+    command_class = BalsamCommand
+    group_class = type
+
+    def get_short_help_str(self, limit: int = 45) -> str:
+        short_help = _first_line_short_help(self, limit)
+        return super().get_short_help_str(limit) if short_help is None else short_help
+
+
 def utc_past(minutes_ago: int) -> datetime:
     return datetime.utcnow() - timedelta(minutes=minutes_ago)
 
@@ -90,7 +115,13 @@ def filter_by_sites(query: T, site_str: str = "") -> T:
 
 
 def list_to_dict(arg_list: List[str]) -> Dict[str, str]:
-    return dict(cast(Tuple[str, str], arg.split("=", maxsplit=1)) for arg in arg_list)
+    result = {}
+    for arg in arg_list:
+        key, sep, value = arg.partition("=")
+        if not sep:
+            raise ValueError(f"Expected KEY=VALUE, got: {arg}")
+        result[key] = value
+    return result
 
 
 def validate_tags(ctx: Any, param: Any, value: List[str]) -> Dict[str, str]:
@@ -104,7 +135,8 @@ def validate_partitions(ctx: Any, param: Any, value: List[str]) -> List[BatchJob
     partitions = []
     for arg in value:
         try:
-            job_mode, num_nodes, *filter_tags_list = arg.split(":")
+            job_mode, num_nodes_str, *filter_tags_list = arg.split(":")
+            num_nodes = int(num_nodes_str)
         except ValueError:
             raise click.BadParameter("needs to be in format MODE:NUM_NODES[:KEY=VALUE]")
         filter_tags: Dict[str, str] = validate_tags(ctx, param, filter_tags_list)
@@ -2,6 +2,7 @@ import logging
 import os
 import subprocess
 import tempfile
+import time
 from abc import ABC, abstractmethod
 from pathlib import Path
 from typing import IO, Dict, List, Optional, Union, cast
@@ -117,6 +118,9 @@ class SubprocessAppRun(AppRun):
     """
 
     _preamble_cache: Dict[str, Path] = {}
+    # Minimum spacing (sec) between successive launches in this process
+    _min_launch_interval: float = 0.0
+    _last_launch_time: float = 0.0
 
     def _build_cmdline(self) -> str:
         return ""
@@ -148,6 +152,15 @@ class SubprocessAppRun(AppRun):
     def _open_outfile(self) -> IO[bytes]:
         return open(self._outfile_path, "wb")
 
+    def _pace_launch(self) -> None:
+        """
+        Sleep only as long as needed to keep launches `_min_launch_interval` apart
+        """
+        wait_time = SubprocessAppRun._last_launch_time + self._min_launch_interval - time.monotonic()
+        if wait_time > 0:
+            time.sleep(wait_time)
+        SubprocessAppRun._last_launch_time = time.monotonic()
+
     def _pre_popen(self) -> None:
         pass
 
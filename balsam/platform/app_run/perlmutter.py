@@ -1,5 +1,3 @@
-import time
-
 from .app_run import SubprocessAppRun
 
 
@@ -8,39 +6,33 @@ class PerlmutterGPURun(SubprocessAppRun):
     https://slurm.schedmd.com/srun.html
     """
 
+    _min_launch_interval = 0.01
+
     def _build_cmdline(self) -> str:
-        node_ids = [h for h in self._node_spec.hostnames]
-        num_nodes = str(len(node_ids))
+        hostnames = self._node_spec.hostnames
         num_ranks = self.get_num_ranks()
-        if num_ranks == 1:
-            network_args = ["--gres=craynetwork:0"]
-        else:
-            network_args = []
-
-        if self._gpus_per_rank > 0:
-            gpu_args = ["--gpus-per-task", self._gpus_per_rank]
-        else:
-            gpu_args = []
+        network_args = ["--gres=craynetwork:0"] if num_ranks == 1 else []
+        gpu_args = ["--gpus-per-task", self._gpus_per_rank] if self._gpus_per_rank > 0 else []
 
         args = [
             "srun",
             *network_args,
             "-n",
-            self.get_num_ranks(),
+            num_ranks,
             "--ntasks-per-node",
             self._ranks_per_node,
             *gpu_args,
             "--nodelist",
-            ",".join(node_ids),
+            ",".join(hostnames),
             "--nodes",
-            num_nodes,
+            len(hostnames),
             "--cpus-per-task",
             self.get_cpus_per_rank(),
             "--mem=40G",
             "--overlap",
             self._cmdline,
         ]
-        return " ".join(str(arg) for arg in args)
+        return " ".join(map(str, args))
 
     def _pre_popen(self) -> None:
-        time.sleep(0.01)
+        self._pace_launch()
@@ -1,5 +1,3 @@
-import time
-
 from .app_run import SubprocessAppRun
 
 
@@ -8,6 +6,8 @@ class SlurmRun(SubprocessAppRun):
     https://slurm.schedmd.com/srun.html
     """
 
+    _min_launch_interval = 0.01
+
     def _build_cmdline(self) -> str:
         node_ids = [h for h in self._node_spec.hostnames]
         num_nodes = str(len(node_ids))
@@ -28,4 +28,4 @@ class SlurmRun(SubprocessAppRun):
         return " ".join(str(arg) for arg in args)
 
     def _pre_popen(self) -> None:
-        time.sleep(0.01)
+        self._pace_launch()
@@ -1,5 +1,3 @@
-import time
-
 from .app_run import SubprocessAppRun
 
 
@@ -8,8 +6,10 @@ class ThetaAprun(SubprocessAppRun):
     https://www.alcf.anl.gov/support-center/theta/running-jobs-and-submission-scripts
     """
 
+    _min_launch_interval = 0.01
+
     def _pre_popen(self) -> None:
-        time.sleep(0.01)
+        self._pace_launch()
 
     def _build_cmdline(self) -> str:
         node_ids = [nid for nid in self._node_spec.node_ids]
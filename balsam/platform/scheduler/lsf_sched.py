@@ -1,12 +1,16 @@
-import json
 import logging
 import os
 import re
 from pathlib import Path
-from typing import Any, Callable, Dict, List, Optional, Union
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
 
 from dateutil.parser import ParserError
 
+try:
+    from orjson import loads as json_loads
+except ModuleNotFoundError:
+    from json import loads as json_loads
+
 from balsam.util import parse_to_utc
 
 from .scheduler import (
@@ -22,6 +26,42 @@ from .scheduler import (
 PathLike = Union[Path, str]
 logger = logging.getLogger(__name__)
 
+# bslots backfill duration formats, e.g. "2 hours 30 minutes 0 seconds"
+_HMS_PATTERN = re.compile(r"hours.*minutes.*seconds")
+_MS_PATTERN = re.compile(r"minutes.*seconds")
+
+
+def _parse_state(state: str) -> str:
+    return LsfScheduler._job_states[state]
+
+
+def _parse_num_nodes(num_slots: str) -> int:
+    # NREQ_SLOT counts 42 slots per node
+    return 0 if num_slots == "-" else int(num_slots) // 42
+
+
+def _parse_wall_time(minutes: str) -> int:
+    return int(float(minutes))
+
+
+def _parse_run_time(run_time: str) -> int:
+    # e.g. "16038 second(s)"
+    return int(run_time.split()[0]) // 60
+
+
+# when reading these fields from the scheduler apply
+# these maps to the string extracted from the output
+_STATUS_FIELD_MAP: Dict[str, Callable[[str], Any]] = {
+    "scheduler_id": int,
+    "state": _parse_state,
+    "queue": str,
+    "num_nodes": _parse_num_nodes,
+    "wall_time_min": _parse_wall_time,
+    "project": str,
+    "time_remaining_min": _parse_run_time,
+    "queued_time_min": int,
+}
+
 
 class LsfScheduler(SubprocessSchedulerInterface):
     status_exe = "bjobs"
@@ -64,32 +104,21 @@ class LsfScheduler(SubprocessSchedulerInterface):
         env["LSB_BJOBS_FORMAT"] = " ".join(fields)
         return env
 
-    # when reading these fields from the scheduler apply
-    # these maps to the string extracted from the output
     @staticmethod
     def _status_field_map(balsam_field: str) -> Optional[Callable[[str], Any]]:
-        status_field_map = {
-            "scheduler_id": lambda id: int(id),
-            "state": lambda state: LsfScheduler._job_states[state],
-            "queue": lambda queue: str(queue),
-            "num_nodes": lambda n: 0 if n == "-" else int(int(n) // 42),
-            "wall_time_min": lambda minutes: int(float(minutes)),
-            "project": lambda project: str(project),
-            "time_remaining_min": lambda time: int(int(time.split()[0]) / 60),
-            "queued_time_min": lambda minutes: int(minutes),
-        }
-        return status_field_map.get(balsam_field, None)
+        return _STATUS_FIELD_MAP.get(balsam_field)
 
     @staticmethod
     def _render_submit_args(
         script_path: PathLike, project: str, queue: str, num_nodes: int, wall_time_min: int, **kwargs: Any
     ) -> List[str]:
+        log_base = os.path.splitext(os.path.basename(script_path))[0]
         args = [
             LsfScheduler.submit_exe,
             "-o",
-            os.path.basename(os.path.splitext(script_path)[0]) + ".output",
+            log_base + ".output",
             "-e",
-            os.path.basename(os.path.splitext(script_path)[0]) + ".error",
+            log_base + ".error",
             "-P",
             project,
             "-q",
@@ -173,16 +202,23 @@ class LsfScheduler(SubprocessSchedulerInterface):
         #     "RUNTIMELIMIT":"1440.0",
         #     "RUN_TIME":"16038 second(s)"
         #   },
-        json_output = json.loads(raw_output)
+        json_output = json_loads(raw_output)
         status_dict = {}
         batch_jobs = json_output["RECORDS"]
+
+        # Resolve the field parsers once, rather than once per job record
+        field_parsers: Dict[str, Tuple[str, Callable[[str], Any]]] = {}
+        for balsam_key, scheduler_key in LsfScheduler._status_fields.items():
+            func = LsfScheduler._status_field_map(balsam_key)
+            if callable(func):
+                field_parsers[balsam_key] = (scheduler_key, func)
+
         for job_data in batch_jobs:
-            status = {}
             try:
-                for balsam_key, scheduler_key in LsfScheduler._status_fields.items():
-                    func = LsfScheduler._status_field_map(balsam_key)
-                    if callable(func):
-                        status[balsam_key] = func(job_data[scheduler_key])
+                status = {
+                    balsam_key: func(job_data[scheduler_key])
+                    for balsam_key, (scheduler_key, func) in field_parsers.items()
+                }
             except KeyError:
                 logger.warning("failed parsing job data: %s", job_data)
             else:
@@ -207,10 +243,10 @@ class LsfScheduler(SubprocessSchedulerInterface):
         parts = line.split()
         nodes = int(parts[0])
         backfill_time = 0
-        if len(re.findall("hours.*minutes.*seconds", line)) > 0:
+        if _HMS_PATTERN.search(line):
             backfill_time += int(parts[1]) * 60
             backfill_time += int(parts[3])
-        elif len(re.findall("minutes.*seconds", line)) > 0:
+        elif _MS_PATTERN.search(line):
             backfill_time += int(parts[1])
 
         return SchedulerBackfillWindow(num_nodes=nodes, wall_time_min=backfill_time)
@@ -224,7 +260,7 @@ class LsfScheduler(SubprocessSchedulerInterface):
         args += ["-json"]
         args += [str(scheduler_id)]
         stdout = scheduler_subproc(args)
-        json_output = json.loads(stdout)
+        json_output = json_loads(stdout)
         if json_output["JOBS"] == 0:
             logger.error("no job found for JOB ID = %s", scheduler_id)
             return SchedulerJobLog()
@@ -1,4 +1,5 @@
 import datetime
+import functools
 import logging
 import os
 from pathlib import Path
@@ -21,19 +22,19 @@ logger = logging.getLogger(__name__)
 
 
 # parse "00:00:00" to minutes
+@functools.lru_cache(maxsize=1024)
 def parse_clock(t_str: str) -> int:
     parts = t_str.split(":")
-    n = len(parts)
-    H = M = S = 0
-    if n == 3:
-        H, M, S = map(int, parts)
-    elif n == 2:
-        M, S = map(int, parts)
-
-    return H * 60 + M + round(S / 60)
+    if len(parts) == 1:
+        # Slurm reads a bare integer as minutes; anything else (e.g. "" or "INVALID") is zero
+        return int(parts[0]) if parts[0].isdigit() else 0
+    # Left-pad missing fields with zeros: "M:S" -> (0, 0, M, S)
+    D, H, M, S = (0,) * (4 - len(parts)) + tuple(map(int, parts))
+    return D * 1440 + H * 60 + M + (S + 30) // 60
 
 
 # parse "1-00:00:00" to minutes
+@functools.lru_cache(maxsize=1024)
 def parse_time_minutes(t_str: str) -> Optional[int]:
     mins = 0
     try:
@@ -63,6 +64,24 @@ def parse_queued_time(t_str: str) -> Optional[int]:
         return int(mins)
 
 
+def _parse_state(state: str) -> str:
+    return SlurmScheduler._job_state_map(state)
+
+
+# when reading these fields from the scheduler apply
+# these maps to the string extracted from the output
+_STATUS_FIELD_MAP: Dict[str, Callable[[str], Any]] = {
+    "scheduler_id": int,
+    "state": _parse_state,
+    "queue": str,
+    "num_nodes": int,
+    "wall_time_min": parse_time_minutes,
+    "project": str,
+    "time_remaining_min": parse_time_minutes,
+    "queued_time_min": parse_queued_time,
+}
+
+
 class SlurmScheduler(SubprocessSchedulerInterface):
     status_exe = "squeue"
     submit_exe = "sbatch"
@@ -108,21 +127,9 @@ class SlurmScheduler(SubprocessSchedulerInterface):
         "queued_time_min": "submittime",
     }
 
-    # when reading these fields from the scheduler apply
-    # these maps to the string extracted from the output
     @staticmethod
     def _status_field_map(balsam_field: str) -> Optional[Callable[[str], Any]]:
-        status_field_map = {
-            "scheduler_id": lambda id: int(id),
-            "state": SlurmScheduler._job_state_map,
-            "queue": lambda queue: str(queue),
-            "num_nodes": lambda n: int(n),
-            "wall_time_min": parse_time_minutes,
-            "project": lambda project: str(project),
-            "time_remaining_min": parse_time_minutes,
-            "queued_time_min": parse_queued_time,
-        }
-        return status_field_map.get(balsam_field, None)
+        return _STATUS_FIELD_MAP.get(balsam_field)
 
     # maps node list states to Balsam node states
     # descriptions: https://slurm.schedmd.com/sinfo.html
@@ -188,7 +195,7 @@ class SlurmScheduler(SubprocessSchedulerInterface):
     # these maps to the string extracted from the output
     @staticmethod
     def _backfill_field_map(balsam_field: str) -> Callable[[str], Any]:
-        nodelist_field_map = {
+        nodelist_field_map: Dict[str, Callable[[str], Any]] = {
             "queues": lambda q: q.split(":"),
             "state": SlurmScheduler._node_state_map,
             "backfill_time": parse_time_minutes,
@@ -209,12 +216,13 @@ class SlurmScheduler(SubprocessSchedulerInterface):
     def _render_submit_args(
         script_path: PathLike, project: str, queue: str, num_nodes: int, wall_time_min: int, **kwargs: Any
     ) -> List[str]:
+        log_base = os.path.splitext(os.path.basename(script_path))[0]
         args = [
             SlurmScheduler.submit_exe,
             "-o",
-            os.path.basename(os.path.splitext(script_path)[0]) + ".output",
+            log_base + ".output",
             "-e",
-            os.path.basename(os.path.splitext(script_path)[0]) + ".error",
+            log_base + ".error",
             "-A",
             project,
             "-q",
@@ -61,7 +61,7 @@ class {{model_name}}({{model_base}}):
         return super().__init__(**_kwargs)
     {% endif %}
 
-class {{query_name}}(Query[{{model_name}}]):
+class {{query_name}}({{query_base}}):
     {% if not model_filter_kwargs and not order_by_type %}
     pass
     {% endif %}
@@ -346,6 +346,7 @@ def get_model_ctx(model_base: Type[BalsamModel], manager_base: type, filterset:
     name = base_name[: base_name.find("Base")]
     manager_name = f"{name}Manager"
     query_name = f"{name}Query"
+    query_base = getattr(sys.modules[model_base.__module__], f"{name}QueryBase", None)
     base_name = qual_path(model_base)
 
     create_fields, update_fields, read_fields = get_model_fields(model_base)
@@ -381,6 +382,7 @@ def get_model_ctx(model_base: Type[BalsamModel], manager_base: type, filterset:
         _read_model_cls=qual_path(model_base.__dict__["_read_model_cls"]),
         manager_name=manager_name,
         query_name=query_name,
+        query_base=qual_path(query_base) if query_base is not None else f"Query[{name}]",
         model_fields=fields,
         model_create_kwargs=create_kwargs,
         manager_base=qual_path(manager_base),
@@ -0,0 +1,34 @@
+"""jobs app_id, state partial index
+
+Revision ID: 3d1c5ef8a2b4
+Revises: f0ef7fd915a1
+Create Date: 2026-10-15 09:12:44.217532
+
+"""
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy import text
+
+# revision identifiers, used by Alembic.
+revision = "3d1c5ef8a2b4"
+down_revision = "f0ef7fd915a1"
+branch_labels = None
+depends_on = None
+
+# The ProcessingService acquires unlocked jobs by (app_id IN ..., state IN ...);
+# only a small fraction of rows are ever in these states.
+# CREATE INDEX ix_jobs_app_state_partial ON jobs (app_id, state)
+#     WHERE state IN ('STAGED_IN', 'RUN_DONE', 'RUN_ERROR', 'RUN_TIMEOUT');
+
+
+def upgrade():
+    op.create_index(
+        "ix_jobs_app_state_partial",
+        "jobs",
+        ["app_id", "state"],
+        postgresql_where=text("state IN ('STAGED_IN', 'RUN_DONE', 'RUN_ERROR', 'RUN_TIMEOUT')"),
+    )
+
+
+def downgrade():
+    op.drop_index("ix_jobs_app_state_partial", "jobs")
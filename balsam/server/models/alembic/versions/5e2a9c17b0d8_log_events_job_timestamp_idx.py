@@ -0,0 +1,30 @@
+"""log_events job_id, timestamp index
+
+Revision ID: 5e2a9c17b0d8
+Revises: 9b7e04c6d5f1
+Create Date: 2026-10-15 10:41:09.306518
+
+"""
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy import text
+
+# revision identifiers, used by Alembic.
+revision = "5e2a9c17b0d8"
+down_revision = "9b7e04c6d5f1"
+branch_labels = None
+depends_on = None
+
+# Event queries select by job and order by timestamp (newest first by default):
+# CREATE INDEX ix_log_events_job_id_timestamp ON log_events (job_id, timestamp DESC);
+# This supersedes the single-column ix_log_events_job_id.
+
+
+def upgrade():
+    op.create_index("ix_log_events_job_id_timestamp", "log_events", ["job_id", text("timestamp DESC")])
+    op.drop_index("ix_log_events_job_id", "log_events")
+
+
+def downgrade():
+    op.create_index("ix_log_events_job_id", "log_events", ["job_id"])
+    op.drop_index("ix_log_events_job_id_timestamp", "log_events")
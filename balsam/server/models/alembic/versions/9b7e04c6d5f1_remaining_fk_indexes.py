@@ -0,0 +1,37 @@
+"""remaining-fk-indexes
+
+Revision ID: 9b7e04c6d5f1
+Revises: 3d1c5ef8a2b4
+Create Date: 2026-10-15 10:03:27.581904
+
+"""
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "9b7e04c6d5f1"
+down_revision = "3d1c5ef8a2b4"
+branch_labels = None
+depends_on = None
+
+# Postgres does not index the referencing side of a FK; without these, the
+# ON DELETE CASCADE / SET NULL actions from sites and batch_jobs scan the child tables.
+# Already covered: jobs.app_id (jobs_app_id_fkey), apps.site_id (unique site_id, name),
+# log_events.job_id and transfer_items.job_id (700eda0f93f8).
+FK_INDEXES = [
+    ("ix_jobs_session_id", "jobs", "session_id"),
+    ("ix_jobs_batch_job_id", "jobs", "batch_job_id"),
+    ("ix_batch_jobs_site_id", "batch_jobs", "site_id"),
+    ("ix_sessions_batch_job_id", "sessions", "batch_job_id"),
+    ("ix_sessions_site_id", "sessions", "site_id"),
+]
+
+
+def upgrade():
+    for name, table, column in FK_INDEXES:
+        op.create_index(name, table, [column])
+
+
+def downgrade():
+    for name, table, _ in FK_INDEXES:
+        op.drop_index(name, table)
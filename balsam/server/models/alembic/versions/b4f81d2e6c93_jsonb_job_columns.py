@@ -0,0 +1,45 @@
+"""jsonb job columns
+
+Revision ID: b4f81d2e6c93
+Revises: 5e2a9c17b0d8
+Create Date: 2026-10-15 11:26:52.740113
+
+"""
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision = "b4f81d2e6c93"
+down_revision = "5e2a9c17b0d8"
+branch_labels = None
+depends_on = None
+
+# Per-job JSON documents become JSONB, like jobs.tags and log_events.data,
+# so they are stored pre-parsed and can be queried with ->, @> and GIN indexes.
+# ALTER TABLE jobs ALTER COLUMN data TYPE jsonb USING data::jsonb;
+JSONB_COLUMNS = [
+    ("jobs", "data"),
+    ("jobs", "launch_params"),
+    ("transfer_items", "transfer_info"),
+]
+
+
+def upgrade():
+    for table, column in JSONB_COLUMNS:
+        op.alter_column(
+            table,
+            column,
+            type_=postgresql.JSONB(astext_type=sa.Text()),
+            postgresql_using=f"{column}::jsonb",
+        )
+
+
+def downgrade():
+    for table, column in JSONB_COLUMNS:
+        op.alter_column(
+            table,
+            column,
+            type_=sa.JSON(),
+            postgresql_using=f"{column}::json",
+        )
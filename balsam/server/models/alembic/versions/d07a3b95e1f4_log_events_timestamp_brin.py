@@ -0,0 +1,29 @@
+"""log_events timestamp BRIN index
+
+Revision ID: d07a3b95e1f4
+Revises: b4f81d2e6c93
+Create Date: 2026-10-15 11:48:15.092367
+
+"""
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "d07a3b95e1f4"
+down_revision = "b4f81d2e6c93"
+branch_labels = None
+depends_on = None
+
+# log_events is append-only, so timestamps follow physical row order and a
+# tiny BRIN index serves the timestamp_after / timestamp_before range filters.
+
+
+def upgrade():
+    op.execute(
+        "CREATE INDEX ix_log_events_timestamp_brin ON log_events "
+        "USING BRIN (timestamp) WITH (pages_per_range=32)"
+    )
+
+
+def downgrade():
+    op.drop_index("ix_log_events_timestamp_brin", "log_events")
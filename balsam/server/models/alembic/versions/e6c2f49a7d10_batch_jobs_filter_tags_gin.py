@@ -0,0 +1,28 @@
+"""batch_jobs filter_tags GIN index
+
+Revision ID: e6c2f49a7d10
+Revises: d07a3b95e1f4
+Create Date: 2026-10-15 13:05:38.614207
+
+"""
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy import text
+
+# revision identifiers, used by Alembic.
+revision = "e6c2f49a7d10"
+down_revision = "d07a3b95e1f4"
+branch_labels = None
+depends_on = None
+
+# BatchJob list queries filter with: batch_jobs.filter_tags @> '{"key": "value"}'::jsonb
+
+
+def upgrade():
+    op.create_index(
+        "ix_batch_jobs_filter_tags", "batch_jobs", [text("filter_tags jsonb_path_ops")], postgresql_using="GIN"
+    )
+
+
+def downgrade():
+    op.drop_index("ix_batch_jobs_filter_tags", "batch_jobs")
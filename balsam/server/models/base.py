@@ -23,6 +23,8 @@ def get_engine() -> Engine:
             balsam.server.settings.database_url,
             pool_size=10,
             max_overflow=40,
+            # Multi-row INSERTs via execute_values and batched UPDATEs via execute_batch
+            executemany_mode="values_plus_batch",
             connect_args={"options": "-c timezone=utc"},
         )
     return _engine
@@ -160,9 +160,12 @@ def acquire(
         .where(models.App.site_id == session.site_id)
         .where(models.Job.session_id.is_(None))  # type: ignore
         .where(models.Job.state.in_(spec.states))
-        .where(models.Job.tags.contains(spec.filter_tags))  # type: ignore
     )
 
+    # tags @> '{}' matches every row, and forces a full scan of the jsonb_path_ops GIN index
+    if spec.filter_tags:
+        job_q = job_q.where(models.Job.tags.contains(spec.filter_tags))  # type: ignore
+
     if spec.app_ids:
         job_q = job_q.where(models.Job.app_id.in_(spec.app_ids))
 
@@ -211,6 +214,19 @@ def tick(db: Session, owner: schemas.UserOut, session_id: int) -> datetime:
     return ts
 
 
+def tick_query(db: Session, owner: schemas.UserOut, filterset: SessionQuery) -> int:
+    session_ids = [sess.id for sess in filterset.apply_filters(owned_session_query(db, owner)).all()]
+    if session_ids:
+        db.query(models.Session).filter(models.Session.id.in_(session_ids)).update(
+            {models.Session.heartbeat: datetime.utcnow()}, synchronize_session=False
+        )
+    db.flush()
+
+    # Clear after updating heartbeats, to avoid clearing the ticked Sessions
+    _clear_stale_sessions(db, owner)
+    return len(session_ids)
+
+
 def delete(db: Session, owner: schemas.UserOut, session_id: int) -> None:
     qs = owned_session_query(db, owner).filter(models.Session.id == session_id)
     session = qs.one()
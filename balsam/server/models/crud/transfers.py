@@ -1,7 +1,7 @@
 from datetime import datetime
 from typing import Iterable, List, Optional, Sequence, Tuple, cast
 
-from sqlalchemy import orm
+from sqlalchemy import insert, orm
 from sqlalchemy.orm import Query, Session
 
 from balsam import schemas
@@ -62,16 +62,22 @@ def _update_jobs(db: Session, job_ids: Sequence[int]) -> None:
         .all()
     )
     now = datetime.utcnow()
+    events = []
     for job in jobs:
         old_state = job.state
         if _set_transfer_state(job):
-            models.LogEvent(
-                job=job,
-                timestamp=now,
-                from_state=old_state,
-                to_state=job.state,
+            events.append(
+                dict(
+                    job_id=job.id,
+                    timestamp=now,
+                    from_state=old_state,
+                    to_state=job.state,
+                    data={},
+                )
             )
     db.flush()
+    if events:
+        db.execute(insert(models.LogEvent.__table__), events)
 
 
 def update(
@@ -142,7 +142,7 @@ class Job(Base):
     batch_job_id = Column(Integer, ForeignKey("batch_jobs.id", ondelete="SET NULL"), nullable=True)
     state = Column(String(32), index=True)
     last_update = Column(DateTime(timezone=True), default=func.now(), onupdate=func.now())
-    data = Column(JSON)
+    data = Column(pg.JSONB)
     return_code = Column(Integer)
     pending_file_cleanup = Column(Boolean, default=True)
     parent_ids = Column(pg.ARRAY(Integer, dimensions=1), default=[], nullable=False)
@@ -154,7 +154,7 @@ class Job(Base):
     gpus_per_rank = Column(Float)
     node_packing_count = Column(Integer)
     wall_time_min = Column(Integer)
-    launch_params = Column(JSON)
+    launch_params = Column(pg.JSONB)
 
     app = orm.relationship("App", back_populates="jobs")
     session: Optional["Session"] = orm.relationship("Session", back_populates="jobs")  # type: ignore
@@ -224,7 +224,7 @@ class TransferItem(Base):
     location_alias = Column(String(256))
     state = Column(Enum(TransferItemState), nullable=False)
     task_id = Column(String(100))
-    transfer_info = Column(JSON, default=dict)
+    transfer_info = Column(pg.JSONB, default=dict)
 
     job = orm.relationship(Job, back_populates="transfer_items")
 
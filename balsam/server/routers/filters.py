@@ -90,7 +90,8 @@ class EventLogQuery:
             qs = qs.filter(BatchJob.scheduler_id == self.scheduler_id)
         if self.tags:
             tags_dict: Dict[str, str] = dict(t.split(":", 1) for t in self.tags if ":" in t)
-            qs = qs.filter(Job.tags.contains(tags_dict))  # type: ignore
+            if tags_dict:
+                qs = qs.filter(Job.tags.contains(tags_dict))  # type: ignore
         if self.data:
             data_dict: Dict[str, str] = dict(d.split(":", 1) for d in self.data if ":" in d)
             qs = qs.filter(LogEvent.data.contains(data_dict))  # type: ignore
@@ -172,7 +173,8 @@ class JobQuery:
             qs = _filter(Job.state.in_(self.state))
         if self.tags:
             tags_dict: Dict[str, str] = dict(t.split(":", 1) for t in self.tags if ":" in t)
-            qs = _filter(Job.tags.contains(tags_dict))  # type: ignore
+            if tags_dict:
+                qs = _filter(Job.tags.contains(tags_dict))  # type: ignore
         if self.pending_file_cleanup:
             qs = _filter(Job.pending_file_cleanup)
         if self.ordering:
@@ -211,7 +213,8 @@ class TransferItemQuery:
             qs = qs.filter(Job.state == self.job_state)
         if self.tags:
             tags_dict = dict(cast(Tuple[str, str], t.split(":", 1)) for t in self.tags if ":" in t)
-            qs = qs.filter(Job.tags.contains(tags_dict))  # type: ignore
+            if tags_dict:
+                qs = qs.filter(Job.tags.contains(tags_dict))  # type: ignore
         return qs
 
 
@@ -257,7 +260,8 @@ class BatchJobQuery:
 
         if self.filter_tags:
             tags_dict: Dict[str, str] = dict(t.split(":", 1) for t in self.filter_tags if ":" in t)
-            qs = qs.filter(BatchJob.filter_tags.contains(tags_dict))  # type: ignore
+            if tags_dict:
+                qs = qs.filter(BatchJob.filter_tags.contains(tags_dict))  # type: ignore
         if self.ordering:
             desc = self.ordering.startswith("-")
             order_col = getattr(BatchJob, self.ordering.lstrip("-"))
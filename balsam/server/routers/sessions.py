@@ -52,6 +52,18 @@ def acquire(
     return ORJSONResponse(content=acquired_jobs)
 
 
+@router.put("/")
+def query_tick(
+    db: orm.Session = Depends(get_webuser_session),
+    user: schemas.UserOut = Depends(auth),
+    q: SessionQuery = Depends(SessionQuery),
+) -> int:
+    """Send a heartbeat to all Sessions selected by the query."""
+    num_ticked = crud.sessions.tick_query(db, owner=user, filterset=q)
+    db.commit()
+    return num_ticked
+
+
 @router.put("/{session_id}")
 def tick(
     session_id: int, db: orm.Session = Depends(get_webuser_session), user: schemas.UserOut = Depends(auth)
@@ -1,4 +1,5 @@
 import logging
+import multiprocessing.connection
 import queue
 import threading
 import time
@@ -107,8 +108,18 @@ class FixedDepthJobSource(Process):
                 break
         return fetched
 
-    def get(self, timeout: Optional[float] = None) -> "Job":
-        job = self.queue.get(block=True, timeout=timeout)
+    def get(self, timeout: Optional[float] = None, wakeup_fd: Optional[int] = None) -> "Job":
+        """
+        Block up to `timeout` seconds for the next Job.  If `wakeup_fd` is given,
+        also return early (raising queue.Empty) as soon as it becomes readable.
+        """
+        if wakeup_fd is None:
+            job = self.queue.get(block=True, timeout=timeout)
+        else:
+            reader = self.queue._reader  # type: ignore
+            if reader not in multiprocessing.connection.wait([reader, wakeup_fd], timeout=timeout):
+                raise queue.Empty
+            job = self.queue.get_nowait()
         job.objects = self.client.Job.objects
         return job
 
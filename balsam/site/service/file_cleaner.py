@@ -2,7 +2,7 @@ import itertools
 import logging
 from collections import defaultdict
 from pathlib import Path
-from typing import TYPE_CHECKING, DefaultDict, List
+from typing import TYPE_CHECKING, Any, DefaultDict, List
 
 from balsam._api.app import ApplicationDefinition
 from balsam.schemas import DeserializeError, JobState
@@ -32,7 +32,8 @@ class FileCleanerService(BalsamService):
         self.cleanup_batch_size = cleanup_batch_size
         ApplicationDefinition._set_client(client)
         try:
-            ApplicationDefinition.load_by_site(self.site_id)  # Warms the cache
+            # Validates the Apps up front; the cache itself is cleared at fork and refilled in _run
+            ApplicationDefinition.load_by_site(self.site_id)
         except DeserializeError as exc:
             logger.warning(
                 f"At least one App registered at this Site failed to deserialize: {exc}. "
@@ -40,6 +41,12 @@ class FileCleanerService(BalsamService):
                 "Balsam Site environment, and double check that the Apps can load OK."
             )
 
+    def _run(self, *args: Any, **kwargs: Any) -> None:
+        self.client.close_session()
+        # The App cache is cleared at fork: refill it with one request instead of one per App
+        ApplicationDefinition.refill_site_cache(self.site_id)
+        super()._run(*args, **kwargs)
+
     def remove_files(self, jobs: List["Job"], cleanup_file_patterns: List[str]) -> None:
         globs = itertools.chain(
             *(job.resolve_workdir(self.data_path).glob(pattern) for job in jobs for pattern in cleanup_file_patterns)
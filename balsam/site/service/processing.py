@@ -1,11 +1,13 @@
 import logging
+import mmap
 import os
 import queue
 import sys
+import time
 from contextlib import contextmanager
 from datetime import datetime
 from pathlib import Path
-from typing import TYPE_CHECKING, Any, Dict, Iterator, Optional, Union
+from typing import TYPE_CHECKING, Any, Dict, Iterator, List, Optional, Tuple, Union
 
 from balsam._api.app import ApplicationDefinition, AppType
 from balsam.schemas import DeserializeError, JobState, JobUpdate
@@ -18,24 +20,42 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 PathLike = Union[str, Path]
+STATUS_BATCH_SIZE = 32
+STATUS_FLUSH_INTERVAL = 0.5
+PYAPP_RETURN_MARKER = b"BALSAM-RETURN-VALUE"
+PYAPP_EXCEPTION_MARKER = b"BALSAM-EXCEPTION"
+PYAPP_RESULT_TAIL_BYTES = 64 * 1024
 
 
 @contextmanager
-def job_context(workdir: Path, stdout_filename: str) -> Iterator[None]:
+def job_context(workdir: PathLike, stdout_filename: str) -> Iterator[None]:
     old_stdout = sys.stdout
     old_stderr = sys.stderr
     old_cwd = os.getcwd()
     try:
         os.chdir(workdir)
     except FileNotFoundError:
-        workdir.mkdir(parents=True, exist_ok=True)
+        os.makedirs(workdir, exist_ok=True)
         os.chdir(workdir)
 
     try:
-        with open(workdir.joinpath(stdout_filename), "a") as fp:
+        with open(os.path.join(workdir, stdout_filename), "a", buffering=1) as fp:
+            # Redirect the underlying fds too, so output written by subprocesses
+            # and C extensions also lands in the job's log file
+            old_stdout.flush()
+            old_stderr.flush()
+            saved_fds = [os.dup(1), os.dup(2)]
+            os.dup2(fp.fileno(), 1)
+            os.dup2(fp.fileno(), 2)
             sys.stdout = fp
             sys.stderr = fp
-            yield
+            try:
+                yield
+            finally:
+                fp.flush()
+                for fd, saved_fd in zip((1, 2), saved_fds):
+                    os.dup2(saved_fd, fd)
+                    os.close(saved_fd)
     finally:
         os.chdir(old_cwd)
         sys.stdout = old_stdout
@@ -43,13 +63,18 @@ def job_context(workdir: Path, stdout_filename: str) -> Iterator[None]:
 
 
 def transition_state(app: ApplicationDefinition) -> None:
-    assert app.job.state is not None
-    transition_func = {
-        JobState.staged_in: app.preprocess,
-        JobState.run_done: app.postprocess,
-        JobState.run_error: app.handle_error,
-        JobState.run_timeout: app.handle_timeout,
-    }[app.job.state]
+    state = app.job.state
+    assert state is not None
+    if state == JobState.staged_in:
+        transition_func = app.preprocess
+    elif state == JobState.run_done:
+        transition_func = app.postprocess
+    elif state == JobState.run_error:
+        transition_func = app.handle_error
+    elif state == JobState.run_timeout:
+        transition_func = app.handle_timeout
+    else:
+        raise KeyError(state)
     try:
         msg = f"Running {transition_func.__name__} for Job {app.job.id}"
         logger.debug(msg)
@@ -66,6 +91,18 @@ def transition_state(app: ApplicationDefinition) -> None:
         }
 
 
+def _find_pyapp_result(buf: Union[bytes, mmap.mmap]) -> Optional[Tuple[bytes, str]]:
+    """Return the last result marker in `buf` and the payload following it on the same line"""
+    ret_idx = buf.rfind(PYAPP_RETURN_MARKER)
+    exc_idx = buf.rfind(PYAPP_EXCEPTION_MARKER)
+    if ret_idx < 0 and exc_idx < 0:
+        return None
+    marker, idx = (PYAPP_RETURN_MARKER, ret_idx) if ret_idx > exc_idx else (PYAPP_EXCEPTION_MARKER, exc_idx)
+    end = buf.find(b"\n", idx)
+    line = buf[idx : len(buf) if end < 0 else end + 1].decode()
+    return marker, line.split(None, 1)[1]
+
+
 def read_pyapp_result(app: ApplicationDefinition) -> None:
     if app._app_type != AppType.PY_FUNC:
         return
@@ -75,31 +112,29 @@ def read_pyapp_result(app: ApplicationDefinition) -> None:
 
     logger.debug(f"Scanning {app.job.workdir / 'job.out'} for python app result")
 
-    return_line = None
-    except_line = None
-    ret_marker = "BALSAM-RETURN-VALUE"
-    exc_marker = "BALSAM-EXCEPTION"
-    with open("job.out") as fp:
-        for line in fp:
-            if ret_marker in line:
-                return_line = line
-                break
-            elif exc_marker in line:
-                except_line = line
-                break
-
     if app.job._update_model is None:
         app.job._update_model = JobUpdate()
 
-    if return_line:
-        return_line = return_line[return_line.find(ret_marker) :]
-        payload = return_line.split(None, 1)[1]
+    # The runner prints its result last: check the tail before mapping the whole file
+    with open("job.out", "rb") as fp:
+        size = os.fstat(fp.fileno()).st_size
+        if size == 0:
+            return
+        fp.seek(max(0, size - PYAPP_RESULT_TAIL_BYTES))
+        result = _find_pyapp_result(fp.read())
+        if result is None and size > PYAPP_RESULT_TAIL_BYTES:
+            with mmap.mmap(fp.fileno(), 0, access=mmap.ACCESS_READ) as buf:
+                result = _find_pyapp_result(buf)
+
+    if result is None:
+        return
+
+    marker, payload = result
+    if marker == PYAPP_RETURN_MARKER:
         app.job._update_model.serialized_return_value = payload
         app.job._update_model.serialized_exception = ""
         logger.debug(f"Set serialized_return_value for Job in {app.job.workdir}")
-    elif except_line:
-        except_line = except_line[except_line.find(exc_marker) :]
-        payload = except_line.split(None, 1)[1]
+    elif marker == PYAPP_EXCEPTION_MARKER:
         app.job._update_model.serialized_exception = payload
         app.job._update_model.serialized_return_value = ""
         logger.debug(f"Set serialized_exception for Job in {app.job.workdir}")
@@ -120,7 +155,7 @@ def run_lifecycle_hook(app: ApplicationDefinition) -> Dict[str, Any]:
     return update_data
 
 
-def handle_job(job: "Job", data_path: Path) -> Dict[str, Any]:
+def handle_job(job: "Job", data_path: str) -> Dict[str, Any]:
     try:
         app_cls = ApplicationDefinition.load_by_id(job.app_id)
     except DeserializeError as exc:
@@ -136,8 +171,11 @@ def handle_job(job: "Job", data_path: Path) -> Dict[str, Any]:
             },
         }
 
+    # Instantiation only binds the Job; a fresh instance keeps any attributes set by
+    # user lifecycle hooks from leaking into the next Job of the same App
     app = app_cls(job)
-    workdir = job.resolve_workdir(data_path)
+    # Plain strings: this runs for every Job, and the workdir is only handed to os functions
+    workdir = os.path.join(data_path, job.workdir)
     with job_context(workdir, "balsam.log"):
         update_data = run_lifecycle_hook(app)
     return update_data
@@ -151,17 +189,37 @@ def run_worker(
     sig_handler = SigHandler()
     if ApplicationDefinition._client is not None:
         ApplicationDefinition._client.close_session()
-    data_path = Path(data_path).resolve()
+    data_path = os.fspath(Path(data_path).resolve())
 
-    while not sig_handler.is_set():
-        try:
-            job = job_source.get(timeout=1)
-        except queue.Empty:
-            continue
-        else:
-            update_data = handle_job(job, data_path)
-            status_updater.put(**update_data)
-            logger.debug(f"Job {job.id} advanced to {job.state}")
+    # The App cache is cleared at fork: refill it with one request instead of one per App
+    ApplicationDefinition.refill_site_cache()
+
+    # Coalesce status updates to amortize the cost of queueing them
+    pending_updates: List[Dict[str, Any]] = []
+    last_flush = time.monotonic()
+    wakeup_fd = sig_handler.wakeup_fd()
+
+    try:
+        while not sig_handler.is_set():
+            # Sleep until a Job or exit signal arrives, waking only to flush pending updates
+            timeout = STATUS_FLUSH_INTERVAL if pending_updates else None
+            try:
+                job = job_source.get(timeout=timeout, wakeup_fd=wakeup_fd)
+            except queue.Empty:
+                pass
+            else:
+                pending_updates.append(handle_job(job, data_path))
+                logger.debug(f"Job {job.id} advanced to {job.state}")
+
+            if pending_updates and (
+                len(pending_updates) >= STATUS_BATCH_SIZE or time.monotonic() - last_flush > STATUS_FLUSH_INTERVAL
+            ):
+                status_updater.put_many(pending_updates)
+                pending_updates = []
+                last_flush = time.monotonic()
+    finally:
+        # Don't lose the updates of Jobs already processed if handle_job raises
+        status_updater.put_many(pending_updates)
 
     logger.info("Signal: ProcessingWorker exit")
 
@@ -180,7 +238,8 @@ class ProcessingService(object):
         self.site_id = site_id
         ApplicationDefinition._set_client(client)
         try:
-            ApplicationDefinition.load_by_site(self.site_id)  # Warms the cache
+            # Validates the Apps up front; the cache itself is cleared at fork and refilled by each worker
+            ApplicationDefinition.load_by_site(self.site_id)
         except DeserializeError as exc:
             logger.warning(
                 f"At least one App registered at this Site failed to deserialize: {exc}. "
@@ -196,6 +255,8 @@ class ProcessingService(object):
         )
         self.status_updater = BulkStatusUpdater(client)
 
+        # One process per worker: job_context changes the cwd and redirects fds 1/2,
+        # which are process-wide, so lifecycle hooks cannot safely share a process
         self.workers = [
             Process(
                 target=run_worker,
@@ -26,7 +26,7 @@ class StatusUpdater(Process):
     def __init__(self, client: "RESTClient") -> None:
         super().__init__()
         self.client = client
-        self.queue: "Queue[Dict[str, Any]]" = Queue()
+        self.queue: "Queue[List[Dict[str, Any]]]" = Queue()
 
     def _run(self) -> None:
         self.client.close_session()
@@ -34,15 +34,13 @@ class StatusUpdater(Process):
 
         while not sig_handler.is_set():
             try:
-                item = self.queue.get(block=True, timeout=1)
+                updates = self.queue.get(block=True, timeout=1)
             except queue.Empty:
                 continue
 
-            updates = [item]
             while len(updates) < 10_000:
                 try:
-                    item = self.queue.get(block=True, timeout=1)
-                    updates.append(item)
+                    updates.extend(self.queue.get(block=True, timeout=1))
                 except queue.Empty:
                     break
             self._perform_updates(updates)
@@ -55,13 +53,30 @@ class StatusUpdater(Process):
         updates = []
         while True:
             try:
-                item = self.queue.get_nowait()
-                updates.append(item)
+                updates.extend(self.queue.get_nowait())
             except queue.Empty:
                 break
         if updates:
             self._perform_updates(updates)
 
+    @staticmethod
+    def _make_update(
+        id: int,
+        state: JobState,
+        state_timestamp: Optional[datetime] = None,
+        state_data: Optional[Dict[str, Any]] = None,
+        **kwargs: Any,
+    ) -> Dict[str, Any]:
+        if state_data is None:
+            state_data = {}
+        return {
+            "id": id,
+            "state": state,
+            "state_timestamp": state_timestamp,
+            "state_data": state_data,
+            **kwargs,
+        }
+
     def put(
         self,
         id: int,
@@ -70,17 +85,15 @@ class StatusUpdater(Process):
         state_data: Optional[Dict[str, Any]] = None,
         **kwargs: Any,
     ) -> None:
-        if state_data is None:
-            state_data = {}
-        self.queue.put_nowait(
-            {
-                "id": id,
-                "state": state,
-                "state_timestamp": state_timestamp,
-                "state_data": state_data,
-                **kwargs,
-            }
-        )
+        self.queue.put_nowait([self._make_update(id, state, state_timestamp, state_data, **kwargs)])
+
+    def put_many(self, updates: List[Dict[str, Any]]) -> None:
+        """
+        Enqueue several updates (each taking the same fields as `put`)
+        with a single queue operation
+        """
+        if updates:
+            self.queue.put_nowait([self._make_update(**update) for update in updates])
 
     def _perform_updates(self, updates: List[Dict[str, Any]]) -> None:
         raise NotImplementedError
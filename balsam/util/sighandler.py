@@ -1,13 +1,16 @@
+import os
 import signal
 from logging import getLogger
 from threading import Event
-from typing import Any
+from typing import Any, Optional, Tuple
 
 logger = getLogger(__name__)
 
 
 class SigHandler:
     _exit_event = Event()
+    _wakeup_pipe: Optional[Tuple[int, int]] = None
+    _wakeup_pid: Optional[int] = None
 
     def __init__(self) -> None:
         """Registers SIGTERM, SIGINT handlers"""
@@ -18,6 +21,7 @@ class SigHandler:
     def _handler(signum: int, stack: Any) -> None:
         logger.debug(f"Caught signal {signum}: setting exit event!")
         SigHandler._exit_event.set()
+        SigHandler._notify_wakeup_fd()
 
     @staticmethod
     def is_set() -> bool:
@@ -33,3 +37,29 @@ class SigHandler:
     def set() -> None:
         """Trigger exit state; time to exit"""
         SigHandler._exit_event.set()
+        SigHandler._notify_wakeup_fd()
+
+    @staticmethod
+    def wakeup_fd() -> int:
+        """
+        Return a file descriptor that becomes readable once triggered.
+        Lets a process block on I/O (e.g. with select) instead of polling is_set()
+        """
+        if SigHandler._wakeup_pipe is None or SigHandler._wakeup_pid != os.getpid():
+            read_fd, write_fd = os.pipe()
+            os.set_blocking(write_fd, False)
+            SigHandler._wakeup_pipe = (read_fd, write_fd)
+            SigHandler._wakeup_pid = os.getpid()
+            if SigHandler.is_set():
+                SigHandler._notify_wakeup_fd()
+        return SigHandler._wakeup_pipe[0]
+
+    @staticmethod
+    def _notify_wakeup_fd() -> None:
+        # A pipe inherited across fork belongs to the parent: leave it alone
+        if SigHandler._wakeup_pipe is None or SigHandler._wakeup_pid != os.getpid():
+            return
+        try:
+            os.write(SigHandler._wakeup_pipe[1], b"\0")
+        except BlockingIOError:
+            pass  # Pipe is full, hence already readable
@@ -0,0 +1,13 @@
+from typing import Iterable
+
+import pytest
+
+from balsam._api.app import ApplicationDefinition
+
+
+@pytest.fixture(autouse=True)
+def clear_app_cache() -> Iterable[None]:
+    """Each test case registers its own Apps: don't let cached App ids leak between tests"""
+    ApplicationDefinition._clear_cache()
+    yield
+    ApplicationDefinition._clear_cache()
@@ -1,5 +1,6 @@
 import random
 from datetime import datetime, timedelta, timezone
+from enum import Enum
 from uuid import uuid4
 
 import pytest
@@ -267,6 +268,57 @@ class TestApps:
         assert loaded_appdef.__app_id__ == AppPy.__app_id__
         assert loaded_appdef.run(None, 5, 4) == 9
 
+    def test_cache_invalidated_on_update(self, client, appdef):
+        Site = client.Site
+        site = Site.objects.create(name="theta", path="/projects/foo")
+        GeomOpt = appdef
+        GeomOpt.site = site
+        GeomOpt.sync()
+        assert ApplicationDefinition.load_by_id(GeomOpt.__app_id__) is GeomOpt
+
+        app = client.App.objects.get(id=GeomOpt.__app_id__)
+        app.description = "Updated description"
+        app.save()
+        assert GeomOpt.__app_id__ not in ApplicationDefinition._app_id_cache
+
+    def test_cache_invalidated_on_site_delete(self, client, appdef):
+        Site = client.Site
+        site = Site.objects.create(name="theta", path="/projects/foo")
+        GeomOpt = appdef
+        GeomOpt.site = site
+        GeomOpt.sync()
+        assert ApplicationDefinition.load_by_name("GeomOpt", site_name="theta") is not None
+        assert ("theta", "GeomOpt") in ApplicationDefinition._app_name_cache
+
+        site.delete()
+        assert ("theta", "GeomOpt") not in ApplicationDefinition._app_name_cache
+        assert GeomOpt.__app_id__ not in ApplicationDefinition._app_id_cache
+
+    def test_refill_site_cache_skips_undeserializable_app(self, client, appdef):
+        Site = client.Site
+        site = Site.objects.create(name="theta", path="/projects/foo")
+        GeomOpt = appdef
+        GeomOpt.site = site
+        GeomOpt.sync()
+        client.App.objects.create(site_id=site.id, name="bad", serialized_class="txt", source_code="txt")
+
+        ApplicationDefinition._clear_cache()
+        ApplicationDefinition.refill_site_cache(site.id)
+        assert {GeomOpt.__app_id__} == set(ApplicationDefinition._app_id_cache)
+
+    def test_refill_site_cache_defaults_to_loaded_sites(self, client, appdef):
+        Site = client.Site
+        site = Site.objects.create(name="theta", path="/projects/foo")
+        GeomOpt = appdef
+        GeomOpt.site = site
+        GeomOpt.sync()
+        ApplicationDefinition.load_by_site(site.id)
+        assert site.id in ApplicationDefinition._loaded_site_ids
+
+        ApplicationDefinition._clear_cache()
+        ApplicationDefinition.refill_site_cache()
+        assert GeomOpt.__app_id__ in ApplicationDefinition._app_id_cache
+
 
 class TestJobs:
     """Jobs and TransferItems"""
@@ -318,6 +370,35 @@ class TestJobs:
         assert job.app_id == GeomOpt.__app_id__
         assert job.state == "STAGED_IN"
 
+    def test_prefetch_apps(self, client, appdef_a, appdef_b):
+        Site = client.Site
+        Job = client.Job
+        site = Site.objects.create(name="theta", path="/projects/foo")
+        for app in [appdef_a, appdef_b]:
+            app.site = site
+            app.sync()
+        Job.objects.bulk_create([Job(f"test/{i}", app_id=app) for i, app in enumerate([appdef_a, appdef_b])])
+
+        ApplicationDefinition._app_id_cache.clear()
+        jobs = list(Job.objects.all().prefetch_apps())
+        assert len(jobs) == 2
+        assert {appdef_a.__app_id__, appdef_b.__app_id__} == set(ApplicationDefinition._app_id_cache)
+
+    def test_prefetch_apps_skips_undeserializable_app(self, client, appdef_a):
+        App = client.App
+        Site = client.Site
+        Job = client.Job
+        site = Site.objects.create(name="theta", path="/projects/foo")
+        appdef_a.site = site
+        appdef_a.sync()
+        bad_app = App.objects.create(site_id=site.id, name="bad", serialized_class="txt", source_code="txt")
+        Job.objects.bulk_create([Job("test/0", app_id=appdef_a.__app_id__), Job("test/1", app_id=bad_app.id)])
+
+        ApplicationDefinition._app_id_cache.clear()
+        jobs = list(Job.objects.all().prefetch_apps())
+        assert len(jobs) == 2
+        assert {appdef_a.__app_id__} == set(ApplicationDefinition._app_id_cache)
+
     def test_set_and_fetch_data(self, client):
         App = client.App
         Site = client.Site
@@ -378,6 +459,43 @@ class TestJobs:
         assert len(subset) == 2
         assert set(job.workdir.as_posix() for job in subset) == {"test/5", "test/6"}
 
+    def test_bulk_create_with_apps(self, client, appdef_a, appdef_b):
+        Site = client.Site
+        Job = client.Job
+        site = Site.objects.create(name="theta", path="/projects/foo")
+        for app in [appdef_a, appdef_b]:
+            app.site = site
+            app.sync()
+
+        specs = [{"workdir": f"test/{i}"} for i in range(4)]
+        specs.append({"workdir": "test/b", "app_id": "AppB"})
+        jobs = Job.objects.bulk_create_with_apps(specs, app=appdef_a)
+        assert len(jobs) == 5
+        assert [job.app_id for job in jobs] == [appdef_a.__app_id__] * 4 + [appdef_b.__app_id__]
+        assert all(job.id is not None for job in jobs)
+
+    def test_bulk_create_with_apps_per_site_name(self, client, appdef_a):
+        Site = client.Site
+        Job = client.Job
+        site1 = Site.objects.create(name="theta1", path="/projects/foo")
+        site2 = Site.objects.create(name="theta2", path="/projects/foo")
+        appdef_a.site = site1
+        appdef_a.sync()
+        app_id1 = appdef_a.__app_id__
+        appdef_a.site = site2
+        appdef_a.__app_id__ = None
+        appdef_a.sync()
+        app_id2 = appdef_a.__app_id__
+        assert app_id1 != app_id2
+
+        specs = [
+            {"workdir": "test/1", "site_name": "theta1"},
+            {"workdir": "test/2", "site_name": "theta2"},
+            {"workdir": "test/3"},
+        ]
+        jobs = Job.objects.bulk_create_with_apps(specs, app="AppA", site_name="theta2")
+        assert [job.app_id for job in jobs] == [app_id1, app_id2, app_id2]
+
     def test_bulk_create_and_update(self, client):
         App = client.App
         Site = client.Site
@@ -589,6 +707,25 @@ class TestJobs:
         with pytest.raises(App.DoesNotExist):
             Job("test/2", app_id="AppB", site_name="theta3")
 
+    def test_create_by_str_and_int_subclasses(self, client, appdef_a):
+        Site = client.Site
+        Job = client.Job
+        site = Site.objects.create(name="theta", path="/projects/foo")
+        AppA = appdef_a
+        AppA.site = site
+        AppA.sync()
+
+        class AppName(str, Enum):
+            app_a = "AppA"
+
+        class AppId(int):
+            pass
+
+        job1 = Job("test/1", app_id=AppName.app_a, site_name="theta")
+        assert job1.app_id == AppA.__app_id__
+        job2 = Job("test/2", app_id=AppId(AppA.__app_id__))
+        assert job2.app_id == AppA.__app_id__
+
     def test_filter_by_state(self, client):
         App = client.App
         Site = client.Site
@@ -1141,6 +1278,25 @@ class TestSessions:
         sess.refresh_from_db()
         assert sess.heartbeat > creation_time
 
+    def test_tick_many(self, client):
+        site = client.Site.objects.create(name="theta", path="/projects/foo")
+        sessions = [self.create_sess(client, site) for _ in range(3)]
+        creation_times = [sess.heartbeat for sess in sessions]
+        client.Session.objects.tick_many(sessions)
+        for sess, creation_time in zip(sessions, creation_times):
+            sess.refresh_from_db()
+            assert sess.heartbeat > creation_time
+
+    def test_acquire_many(self, client):
+        site, app = self.create_site_app(client)
+        self.create_jobs(client, app, num_jobs=4)
+        sessions = [self.create_sess(client, site) for _ in range(2)]
+
+        acquired = client.Session.objects.acquire_many(sessions, max_num_jobs=2, max_nodes_per_job=8)
+        assert [len(jobs) for jobs in acquired] == [2, 2]
+        acquired_ids = [job.id for jobs in acquired for job in jobs]
+        assert len(set(acquired_ids)) == 4
+
     def test_delete(self, client):
         site, app = self.create_site_app(client)
         self.create_jobs(client, app, num_jobs=3)
@@ -1,5 +1,6 @@
 import json
 import os
+import queue
 import shutil
 import socket
 import subprocess
@@ -7,12 +8,14 @@ import tempfile
 import time
 from contextlib import closing
 from pathlib import Path
-from typing import Any, Callable, Dict, Iterable, List, Optional
+from typing import Any, Callable, Iterable, List, Optional
+from urllib.parse import urlsplit
 from uuid import uuid4
 
 import psutil  # type: ignore
 import pytest
 import requests
+from sqlalchemy import delete, insert, select
 
 import balsam.server
 from balsam._api.app import ApplicationDefinition
@@ -20,6 +23,7 @@ from balsam.client import BasicAuthRequestsClient, urls
 from balsam.cmdline.utils import start_site
 from balsam.config import ClientSettings, SiteConfig, balsam_home, site_builder
 from balsam.server import models
+from balsam.server.auth.password_utils import get_hash
 from balsam.shared_apps.demo import Adder, Hello
 from balsam.util import postgres as pg
 
@@ -53,7 +57,7 @@ def setup_database() -> Optional[str]:
         if not session.engine.database.endswith("test"):  # type: ignore
             raise RuntimeError("Database name used for testing must end with 'test'")
         pg.run_alembic_migrations(env_url)
-        session.execute("""TRUNCATE TABLE users CASCADE;""")
+        session.execute("""TRUNCATE TABLE users RESTART IDENTITY CASCADE;""")
         session.commit()
         session.close()
     except Exception as exc:
@@ -126,33 +130,80 @@ def live_server(setup_database: Optional[str], free_port: str, test_log_dir: Pat
 
 
 def _server_health_check(url: str, timeout: float = 10.0, check_interval: float = 0.5) -> bool:
-    """Make requests until getting a response"""
+    """Probe the server port until it accepts connections, then confirm with one request"""
+    parsed = urlsplit(url)
+    address = (parsed.hostname or "localhost", parsed.port or (443 if parsed.scheme == "https" else 80))
     conn_error = None
-    for i in range(int(timeout / check_interval)):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
         try:
-            requests.get(url)
-        except requests.ConnectionError as exc:
-            time.sleep(check_interval)
+            socket.create_connection(address, timeout=check_interval).close()
+        except OSError as exc:
             conn_error = str(exc)
+            time.sleep(check_interval)
         else:
-            return True
-    raise RuntimeError(conn_error)
+            break
+    try:
+        requests.get(url)
+    except requests.ConnectionError as exc:
+        raise RuntimeError(conn_error or str(exc))
+    return True
 
 
-def _make_user_client(url: str) -> BasicAuthRequestsClient:
-    """Create a basicauth client to the given url"""
-    login_credentials: Dict[str, Any] = {"username": f"user{uuid4()}", "password": "test-password"}
-    requests.post(
-        url.rstrip("/") + "/" + urls.PASSWORD_REGISTER,
-        json=login_credentials,
-    )
-    client = BasicAuthRequestsClient(url, **login_credentials)
+TEST_PASSWORD = "test-password"
+USER_POOL_SIZE = 32
+
+
+@pytest.fixture(scope="session")
+def user_pool(setup_database: Optional[str]) -> Callable[[], Optional[str]]:
+    """
+    Returns a function handing out usernames of fresh users with TEST_PASSWORD.
+    Users are bulk-inserted into the test DB `USER_POOL_SIZE` at a time, sharing one
+    password hash, instead of being registered one by one through the API.
+    The function returns None if the DB is managed elsewhere (BALSAM_TEST_API_URL).
+    """
+    usernames: "queue.Queue[str]" = queue.Queue()
+    hashed_password = get_hash(TEST_PASSWORD) if setup_database else None
+
+    def _next_username() -> Optional[str]:
+        if setup_database is None:
+            return None
+        if usernames.empty():
+            batch = [f"user{uuid4()}" for _ in range(USER_POOL_SIZE)]
+            session = models.get_session()
+            session.execute(
+                insert(models.User.__table__),
+                [{"username": username, "hashed_password": hashed_password} for username in batch],
+            )
+            session.commit()
+            session.close()
+            for username in batch:
+                usernames.put(username)
+        return usernames.get_nowait()
+
+    return _next_username
+
+
+def _make_user_client(url: str, username: Optional[str] = None) -> BasicAuthRequestsClient:
+    """
+    Create a basicauth client to the given url.
+    If `username` is not an existing user (with TEST_PASSWORD), register a new one first.
+    """
+    if username is None:
+        username = f"user{uuid4()}"
+        requests.post(
+            url.rstrip("/") + "/" + urls.PASSWORD_REGISTER,
+            json={"username": username, "password": TEST_PASSWORD},
+        )
+    client = BasicAuthRequestsClient(url, username=username, password=TEST_PASSWORD)
     client.refresh_auth()
     return client
 
 
 @pytest.fixture(scope="function")
-def client_factory(live_server: str) -> Iterable[Callable[[], BasicAuthRequestsClient]]:
+def client_factory(
+    setup_database: Optional[str], live_server: str, user_pool: Callable[[], Optional[str]]
+) -> Iterable[Callable[[], BasicAuthRequestsClient]]:
     """
     Returns factory for generating multiple clients per Test case.
     DELETES all Sites at the end of each test case.
@@ -160,14 +211,22 @@ def client_factory(live_server: str) -> Iterable[Callable[[], BasicAuthRequestsC
     created_clients: List[BasicAuthRequestsClient] = []
 
     def _create_client() -> BasicAuthRequestsClient:
-        client = _make_user_client(live_server)
+        client = _make_user_client(live_server, user_pool())
         created_clients.append(client)
         return client
 
     yield _create_client
-    for client in created_clients:
-        for site in client.Site.objects.all():
-            site.delete()
+    if setup_database is None:
+        for client in created_clients:
+            for site in client.Site.objects.all():
+                site.delete()
+    elif created_clients:
+        # One cascading DELETE for all the test users' Sites, instead of a request per Site
+        owner_ids = select(models.User.id).where(models.User.username.in_([c.username for c in created_clients]))
+        session = models.get_session()
+        session.execute(delete(models.Site.__table__).where(models.Site.owner_id.in_(owner_ids)))
+        session.commit()
+        session.close()
 
 
 @pytest.fixture(scope="function")
@@ -188,14 +247,16 @@ def temp_client_file() -> Iterable[str]:
 
 
 @pytest.fixture(scope="module")
-def persistent_client(live_server: str, temp_client_file: str) -> Iterable[BasicAuthRequestsClient]:
+def persistent_client(
+    live_server: str, temp_client_file: str, user_pool: Callable[[], Optional[str]]
+) -> Iterable[BasicAuthRequestsClient]:
     """
     Returns (client, client_settings_path) that persists for a full test module.
     The client can be used across all tests within a single module.
     Subprocesses and launchers must have BALSAM_CLIENT_PATH env to find the credentials.
     Cleans up all Sites at the end of each module.
     """
-    client = _make_user_client(live_server)
+    client = _make_user_client(live_server, user_pool())
     settings = ClientSettings(
         api_root=client.api_root,
         client_class="balsam.client.BasicAuthRequestsClient",
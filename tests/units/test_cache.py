@@ -0,0 +1,77 @@
+import pytest
+
+from balsam._api.cache import TTLCache
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture(scope="function")
+def clock():
+    return FakeClock()
+
+
+def test_entry_expires_after_ttl(clock):
+    cache = TTLCache(maxsize=4, ttl=10.0, timer=clock)
+    cache["a"] = 1
+    clock.now = 9.9
+    assert cache["a"] == 1
+    clock.now = 10.0
+    assert "a" not in cache
+    assert cache.get("a") is None
+    with pytest.raises(KeyError):
+        cache["a"]
+
+
+def test_len_and_iter_skip_expired_entries(clock):
+    cache = TTLCache(maxsize=4, ttl=10.0, timer=clock)
+    cache["a"] = 1
+    clock.now = 5.0
+    cache["b"] = 2
+    clock.now = 12.0
+    assert len(cache) == 1
+    assert list(cache) == ["b"]
+
+
+def test_overwrite_resets_ttl(clock):
+    cache = TTLCache(maxsize=4, ttl=10.0, timer=clock)
+    cache["a"] = 1
+    clock.now = 8.0
+    cache["a"] = 2
+    clock.now = 15.0
+    assert cache["a"] == 2
+
+
+def test_evicts_least_recently_inserted_at_maxsize(clock):
+    cache = TTLCache(maxsize=2, ttl=10.0, timer=clock)
+    cache["a"] = 1
+    cache["b"] = 2
+    cache["c"] = 3
+    assert list(cache) == ["b", "c"]
+
+
+def test_get_refreshes_lru_order(clock):
+    cache = TTLCache(maxsize=2, ttl=10.0, timer=clock)
+    cache["a"] = 1
+    cache["b"] = 2
+    assert cache["a"] == 1
+    cache["c"] = 3
+    assert "b" not in cache
+    assert set(cache) == {"a", "c"}
+
+
+def test_invalidation(clock):
+    cache = TTLCache(maxsize=4, ttl=10.0, timer=clock)
+    cache.update(a=1, b=2, c=3)
+    del cache["a"]
+    assert "a" not in cache
+    assert cache.pop("b") == 2
+    assert cache.pop("b", None) is None
+    cache.clear()
+    assert len(cache) == 0
+    assert "c" not in cache
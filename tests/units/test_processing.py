@@ -0,0 +1,59 @@
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+from balsam._api.app import AppType
+from balsam.site.service import processing
+
+
+def make_app(workdir):
+    job = SimpleNamespace(workdir=Path(workdir), _update_model=None)
+    return SimpleNamespace(_app_type=AppType.PY_FUNC, job=job)
+
+
+@pytest.fixture(scope="function")
+def job_dir(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(processing, "PYAPP_RESULT_TAIL_BYTES", 64)
+    return tmp_path
+
+
+def test_reads_return_value_from_tail(job_dir):
+    job_dir.joinpath("job.out").write_text("x" * 500 + "\nBALSAM-RETURN-VALUE abc123\n")
+    app = make_app(job_dir)
+    processing.read_pyapp_result(app)
+    assert app.job._update_model.serialized_return_value == "abc123\n"
+    assert app.job._update_model.serialized_exception == ""
+
+
+def test_falls_back_to_full_scan(job_dir):
+    job_dir.joinpath("job.out").write_text("BALSAM-EXCEPTION exc456\n" + "y" * 500 + "\n")
+    app = make_app(job_dir)
+    processing.read_pyapp_result(app)
+    assert app.job._update_model.serialized_exception == "exc456\n"
+    assert app.job._update_model.serialized_return_value == ""
+
+
+def test_last_marker_wins(job_dir):
+    job_dir.joinpath("job.out").write_text("BALSAM-EXCEPTION exc\n" + "z" * 500 + "\nBALSAM-RETURN-VALUE ret\n")
+    app = make_app(job_dir)
+    processing.read_pyapp_result(app)
+    assert app.job._update_model.serialized_return_value == "ret\n"
+
+
+def test_no_marker(job_dir):
+    job_dir.joinpath("job.out").write_text("w" * 500 + "\n")
+    app = make_app(job_dir)
+    processing.read_pyapp_result(app)
+    assert app.job._update_model.serialized_return_value is None
+    assert app.job._update_model.serialized_exception is None
+
+
+def test_empty_job_out(job_dir):
+    job_dir.joinpath("job.out").write_text("")
+    app = make_app(job_dir)
+    processing.read_pyapp_result(app)
+    assert app.job._update_model is not None
+    assert app.job._update_model.serialized_return_value is None
+    assert app.job._update_model.serialized_exception is None
@@ -1,2 +1,36 @@
+import pytest
+
+from balsam.platform.scheduler.slurm_sched import parse_clock, parse_time_minutes
+
+
 def test_blank():
     assert 1
+
+
+@pytest.mark.parametrize(
+    "t_str, minutes",
+    [
+        ("45", 45),
+        ("", 0),
+        ("INVALID", 0),
+        ("10:29", 10),
+        ("10:30", 11),
+        ("1:30:00", 90),
+        ("1:00:00:00", 1440),
+    ],
+)
+def test_slurm_parse_clock(t_str, minutes):
+    assert parse_clock(t_str) == minutes
+
+
+@pytest.mark.parametrize(
+    "t_str, minutes",
+    [
+        ("45", 45),
+        ("", 0),
+        ("1-02:00:00", 1560),
+        ("1:2:3:4:5", None),
+    ],
+)
+def test_slurm_parse_time_minutes(t_str, minutes):
+    assert parse_time_minutes(t_str) == minutes